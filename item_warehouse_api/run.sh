@@ -7,6 +7,8 @@ DATABASE_DRIVER_NAME_IN=$(bashio::config 'database_driver_name')
 DATABASE_HOST_IN=$(bashio::config 'database_host')
 DATABASE_PORT_IN=$(bashio::config 'database_port')
 DATABASE_NAME_IN=$(bashio::config 'database_name')
+DATABASE_POOL_SIZE_IN=$(bashio::config 'database_pool_size')
+DATABASE_MAX_OVERFLOW_IN=$(bashio::config 'database_max_overflow')
 
 
 if [[ -z "${DATABASE_URL-}" ]]
@@ -44,7 +46,18 @@ then
     export DATABASE_NAME=${DATABASE_NAME_IN}
 fi
 
+if [[ -z "${DATABASE_POOL_SIZE-}" ]]
+then
+    export DATABASE_POOL_SIZE=${DATABASE_POOL_SIZE_IN}
+fi
+
+if [[ -z "${DATABASE_MAX_OVERFLOW-}" ]]
+then
+    export DATABASE_MAX_OVERFLOW=${DATABASE_MAX_OVERFLOW_IN}
+fi
+
 
 uvicorn main:app \
 --host 0.0.0.0 \
---port 8002
+--port 8002 \
+--timeout-keep-alive 75
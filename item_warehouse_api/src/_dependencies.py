@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 from collections.abc import Generator
-from logging import getLogger
+from json import JSONDecodeError, loads
+from logging import DEBUG, getLogger
 from os import getenv
+from typing import Any
 
 from _helpers import add_stream_handler
 from database import SessionLocal
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 LOGGER = getLogger(__name__)
-LOGGER.setLevel(getenv("LOG_LEVEL", "DEBUG"))
+LOGGER.setLevel(getenv("LOG_LEVEL", "INFO"))
 add_stream_handler(LOGGER)
 
 
@@ -22,9 +27,73 @@ def get_db(session_name: str = "") -> Generator[Session]:
     try:
         yield db
     finally:
-        if session_name:
-            LOGGER.debug("Closing database connection for %s.", session_name)
+        db.close()
+
+        if LOGGER.isEnabledFor(DEBUG):
+            LOGGER.debug(
+                "Closed database connection%s.",
+                f" for {session_name}" if session_name else "",
+            )
+
+
+async def get_raw_body(request: Request) -> bytes:
+    """Get the raw request body, for validating JSON straight into a schema.
+
+    Reading the body is async, so this lets sync endpoints skip FastAPI's
+    JSON-to-dict decoding without blocking the event loop with database calls.
+    """
+
+    return await request.body()
+
+
+# The errors pydantic raises for a body of the wrong JSON type (i.e. for an item model
+# or a list of items), and the ones FastAPI would have raised instead
+_BODY_TYPE_ERRORS: dict[str, dict[str, Any]] = {
+    "model_type": {"type": "dict_type", "msg": "Input should be a valid dictionary"},
+    "list_type": {"type": "list_type", "msg": "Input should be a valid list"},
+}
+
+
+def body_validation_error(
+    exc: ValidationError, body: bytes, /
+) -> RequestValidationError | ValidationError:
+    """Get the error to raise for a request body which failed validation.
+
+    Bodies from `get_raw_body` skip FastAPI's own decoding, so errors with the body as a
+    whole (i.e. it's empty, not JSON, or not the right JSON type) are reported with the
+    same `loc`s and `type`s FastAPI uses. Any other errors are left as-is.
+
+    Args:
+        exc (ValidationError): The error raised while validating the body.
+        body (bytes): The raw request body.
+
+    Returns:
+        RequestValidationError | ValidationError: The error to raise instead, or `exc`
+            if it wasn't an error with the body as a whole.
+    """
+
+    errors: list[dict[str, Any]] = []
+
+    for error in exc.errors():
+        if error["loc"] or error["type"] not in ("json_invalid", *_BODY_TYPE_ERRORS):
+            return exc
+
+        if not body:
+            errors.append(
+                {"type": "missing", "loc": ("body",), "msg": "Field required"}
+            )
+        elif error["type"] == "json_invalid":
+            try:
+                loads(body)
+            except JSONDecodeError as decode_exc:
+                loc: tuple[str | int, ...] = ("body", decode_exc.pos)
+            else:
+                loc = ("body",)
+
+            errors.append(
+                {"type": "json_invalid", "loc": loc, "msg": "JSON decode error"}
+            )
         else:
-            LOGGER.debug("Closing database connection.")
+            errors.append(_BODY_TYPE_ERRORS[error["type"]] | {"loc": ("body",)})
 
-        db.close()
+    return RequestValidationError(errors, body=body)
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from logging import DEBUG, Formatter, Logger, StreamHandler
 from sys import stdout
-from time import gmtime
+from time import gmtime, monotonic
+from typing import Generic, TypeVar
 
 FORMATTER = Formatter(
     fmt="%(asctime)s\t%(name)s\t[%(levelname)s]\t%(message)s",
@@ -12,6 +13,9 @@ FORMATTER = Formatter(
 )
 FORMATTER.converter = gmtime
 
+K = TypeVar("K")
+V = TypeVar("V")
+
 
 def add_stream_handler(logger: Logger, *, level: int = DEBUG) -> Logger:
     """Add a StreamHandler to an existing logger.
@@ -32,3 +36,58 @@ def add_stream_handler(logger: Logger, *, level: int = DEBUG) -> Logger:
     logger.addHandler(s_handler)
 
     return logger
+
+
+class TTLCache(Generic[K, V]):
+    """A simple in-memory cache whose entries expire after a fixed time-to-live."""
+
+    def __init__(self, ttl: float) -> None:
+        """Initialise the cache.
+
+        Args:
+            ttl (float): The number of seconds entries are kept for.
+        """
+        self.ttl = ttl
+        self._entries: dict[K, tuple[float, V]] = {}
+
+    def get(self, key: K) -> V | None:
+        """Get an entry from the cache.
+
+        Args:
+            key (K): The key of the entry to get.
+
+        Returns:
+            V | None: The cached value, or None if it's missing or has expired.
+        """
+        if (entry := self._entries.get(key)) is None:
+            return None
+
+        expires_at, value = entry
+
+        if expires_at <= monotonic():
+            self._entries.pop(key, None)
+            return None
+
+        return value
+
+    def set(self, key: K, value: V) -> V:
+        """Add an entry to the cache.
+
+        Args:
+            key (K): The key of the entry.
+            value (V): The value to cache.
+
+        Returns:
+            V: The cached value, returned for use in one-liners.
+        """
+        self._entries[key] = (monotonic() + self.ttl, value)
+
+        return value
+
+    def pop(self, key: K) -> None:
+        """Remove an entry from the cache, if it's present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._entries.clear()
@@ -2,35 +2,46 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+from copy import deepcopy
 from json import dumps
-from logging import getLogger
+from logging import DEBUG, getLogger
 from os import getenv
-from typing import TYPE_CHECKING, Literal, overload
+from typing import TYPE_CHECKING, Any, Literal, overload
 
-from _helpers import add_stream_handler
+from _helpers import TTLCache, add_stream_handler
 from database import GeneralItemModelType, SqlStrPath
 from exceptions import (
+    InvalidCursorError,
     InvalidFieldsError,
     ItemExistsError,
     ItemNotFoundError,
+    ItemSchemaExistsError,
     ItemSchemaNotFoundError,
     TooManyResultsError,
+    WarehouseExistsError,
     WarehouseNotFoundError,
 )
 from fastapi import HTTPException, status
 from models import ItemPage, Warehouse, WarehousePage
+from pydantic_core import to_jsonable_python
 from schemas import (
     DisplayType,
     ItemBase,
-    ItemResponse,
+    ItemBatchRequest,
     ItemSchema,
+    PythonType,
     QueryParamType,
     WarehouseCreate,
 )
+from sqlalchemy import Column, Table, delete, insert, or_, select
+from sqlalchemy.engine import RowMapping  # type: ignore[attr-defined]
 from sqlalchemy.exc import DatabaseError, IntegrityError
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Session
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from pydantic.main import IncEx
 
 else:
@@ -38,39 +49,164 @@ else:
 
 
 LOGGER = getLogger(__name__)
-LOGGER.setLevel(getenv("LOG_LEVEL", "DEBUG"))
+LOGGER.setLevel(getenv("LOG_LEVEL", "INFO"))
 add_stream_handler(LOGGER)
 
+# Warehouses are rarely created or deleted compared to how often their items are
+# accessed, so they're kept in memory (detached from any session) once loaded. The TTL
+# means changes made outside of this process are picked up eventually too.
+_WAREHOUSES: TTLCache[str, Warehouse] = TTLCache(ttl=30)
+
+# Item schemas are looked up far more often than they change, so the mappings of item and
+# warehouse names to schemas are kept for a short while. They're cleared whenever a
+# warehouse or its schema changes.
+_SCHEMAS: TTLCache[str, dict[str, ItemSchema]] = TTLCache(ttl=30)
+
+# Pages of warehouses, keyed on (offset, limit, after). Cleared alongside `_SCHEMAS`.
+_WAREHOUSE_PAGES: TTLCache[tuple[int, int | None, str | None], WarehousePage] = (
+    TTLCache(ttl=30)
+)
+
+
+def _insert_returning(
+    db: Session, /, table: Table, values: dict[str, Any]
+) -> RowMapping:
+    """Insert a row and return it as it was stored by the database.
+
+    Where the dialect supports it, the row is read back with `INSERT ... RETURNING`
+    so that only a single round trip is made. Otherwise, the row is re-selected by its
+    primary key.
+
+    Args:
+        db (Session): The database session to use.
+        table (Table): The table to insert the row into.
+        values (dict[str, Any]): The column values of the new row.
+
+    Returns:
+        RowMapping: The inserted row.
+    """
+    if db.get_bind().dialect.insert_returning:
+        return (
+            db.execute(insert(table).values(values).returning(table)).mappings().one()
+        )
+
+    inserted_pk = db.execute(insert(table).values(values)).inserted_primary_key
+
+    return (
+        db.execute(
+            select(table).where(  # type: ignore[arg-type]
+                *(
+                    column == value
+                    for column, value in zip(
+                        table.primary_key, inserted_pk, strict=True
+                    )
+                )
+            )
+        )
+        .mappings()
+        .one()
+    )
+
+
+def _pk_for_error(warehouse: Warehouse, pk_values: dict[str, Any]) -> dict[str, Any]:
+    """Get an item's PK values in the form they're reported in errors.
+
+    Values are converted to their JSON form (e.g. dates to ISO strings) and ordered by
+    the warehouse's PK fields, so that the same clash is reported identically whether
+    it came from a single or bulk insert.
+
+    Args:
+        warehouse (Warehouse): The warehouse the item belongs to.
+        pk_values (dict[str, Any]): The item's PK values, keyed on field name.
+
+    Returns:
+        dict[str, Any]: The JSON-compatible PK values.
+    """
+
+    return to_jsonable_python(  # type: ignore[no-any-return]
+        {pk_name: pk_values[pk_name] for pk_name in warehouse.pk_name}
+    )
+
 
 # Warehouse Operations
 
 
 def create_warehouse(db: Session, /, warehouse: WarehouseCreate) -> Warehouse:
-    """Create a warehouse."""
-    db_warehouse = Warehouse(**warehouse.model_dump(exclude_unset=True, by_alias=True))
+    """Create a warehouse.
+
+    Args:
+        db (Session): The database session to use.
+        warehouse (WarehouseCreate): The warehouse to create.
+
+    Raises:
+        _HTTPException: Raised as a `WarehouseExistsError` if a warehouse with the same
+            name already exists, or as an `ItemSchemaExistsError` if a warehouse with
+            the same item name already exists.
+        DatabaseError: If the warehouse's table can't be created. Anything already
+            created for it is dropped first.
+
+    Returns:
+        Warehouse: The created warehouse.
+    """
+
+    # Both uniqueness checks are made in a single query
+    clashes = db.execute(
+        select(
+            Warehouse.name, Warehouse.item_name, Warehouse.created_at  # type: ignore[arg-type]
+        ).where(
+            or_(
+                Warehouse.name == warehouse.name,
+                Warehouse.item_name == warehouse.item_name,
+            )
+        )
+    ).all()
+
+    for clash in clashes:
+        if clash.name == warehouse.name:
+            raise WarehouseExistsError(clash)
+
+    if clashes:
+        raise ItemSchemaExistsError(warehouse.item_name)
+
+    warehouse_values = warehouse.model_dump(exclude_unset=True, by_alias=True)
+    db_warehouse = Warehouse(**warehouse_values)
+
+    # Anything still cached under this name belongs to a warehouse which no longer
+    # exists (e.g. one deleted by another process)
+    db_warehouse.clear_item_caches()
 
     try:
         db_warehouse.intialise_warehouse()
-        db.add(db_warehouse)
+        warehouse_row = _insert_returning(db, Warehouse.__table__, warehouse_values)
         db.commit()
-        db.refresh(db_warehouse)
     except DatabaseError:
         db_warehouse.drop(no_exist_ok=True)
         raise
 
-    return db_warehouse
+    _SCHEMAS.clear()
+    _WAREHOUSE_PAGES.clear()
+
+    return _WAREHOUSES.set(warehouse.name, Warehouse(**warehouse_row))
 
 
 def delete_warehouse(db: Session, /, warehouse_name: SqlStrPath) -> None:
     """Delete a warehouse."""
     warehouse = get_warehouse(db, warehouse_name)
 
+    _WAREHOUSES.pop(warehouse_name)
     warehouse.drop(no_exist_ok=True)
 
-    if db.query(Warehouse).filter(Warehouse.name == warehouse_name).delete() == 0:
+    if (
+        db.execute(
+            delete(Warehouse.__table__).where(Warehouse.name == warehouse_name)
+        ).rowcount
+        == 0
+    ):
         raise WarehouseNotFoundError(warehouse_name)
 
     db.commit()
+    _SCHEMAS.clear()
+    _WAREHOUSE_PAGES.clear()
 
 
 @overload
@@ -90,6 +226,9 @@ def get_warehouse(
 ) -> Warehouse | None:
     """Get a warehouse by its name."""
 
+    if (warehouse := _WAREHOUSES.get(name)) is not None:
+        return warehouse
+
     if (
         warehouse := db.query(Warehouse).filter(Warehouse.name == name).first()
     ) is None:
@@ -97,7 +236,10 @@ def get_warehouse(
             return None
         raise WarehouseNotFoundError(name)
 
-    return warehouse
+    # Detach the warehouse so it outlives this session without being expired
+    db.expunge(warehouse)  # type: ignore[no-untyped-call]
+
+    return _WAREHOUSES.set(name, warehouse)
 
 
 def get_warehouses(
@@ -106,6 +248,7 @@ def get_warehouses(
     *,
     offset: int = 0,
     limit: int | None = None,
+    after: str | None = None,
     allow_no_warehouse_table: bool = False,
 ) -> WarehousePage:
     """Get a list of warehouses.
@@ -116,6 +259,9 @@ def get_warehouses(
             Defaults to 0.
         limit (int, optional): The limit to use when querying the database.
             Defaults to 100.
+        after (str, optional): The name of the warehouse to continue after. Takes
+            precedence over `offset`, and the page won't have a page number. Defaults
+            to None.
         allow_no_warehouse_table (bool, optional): Whether to suppress the error
             thrown because there is no `warehouse` table. Defaults to False.
 
@@ -123,14 +269,30 @@ def get_warehouses(
         list[Warehouse]: A list of warehouses.
     """
 
+    cache_key = (offset, limit, after)
+
+    if (warehouse_page := _WAREHOUSE_PAGES.get(cache_key)) is not None:
+        return warehouse_page
+
     try:
-        query = db.query(Warehouse).offset(offset)
+        query = db.query(Warehouse).order_by(Warehouse.name)
+
+        query = (
+            query.filter(Warehouse.name > after)
+            if after is not None
+            else query.offset(offset)
+        )
 
         if limit is not None:
             query = query.limit(limit)
 
         warehouses = query.all()
-        total = db.query(Warehouse).count()
+
+        if limit is None and offset == 0 and after is None:
+            # Every warehouse has been fetched, so there's no need to count them again
+            total = len(warehouses)
+        else:
+            total = db.query(Warehouse).count()
     except DatabaseError as exc:
         if (
             allow_no_warehouse_table
@@ -140,14 +302,27 @@ def get_warehouses(
 
         raise
 
-    limit = limit or total
+    page_kwargs = {}
 
-    return WarehousePage(
-        count=len(warehouses),
-        warehouses=warehouses,
-        max_page=total // limit,
-        page=(offset // limit) + 1,
-        total=total,
+    if limit is not None and len(warehouses) == limit:
+        page_kwargs["next_cursor"] = warehouses[-1].name
+
+    limit = limit or total or 1
+
+    # As in `get_warehouse`, the warehouses need to outlive this session
+    for warehouse in warehouses:
+        db.expunge(warehouse)  # type: ignore[no-untyped-call]
+
+    return _WAREHOUSE_PAGES.set(
+        cache_key,
+        WarehousePage(
+            count=len(warehouses),
+            warehouses=warehouses,
+            max_page=total // limit,
+            page=None if after is not None else (offset // limit) + 1,
+            total=total,
+            **page_kwargs,
+        ),
     )
 
 
@@ -225,14 +400,33 @@ def get_schema(
     return results[0][0]
 
 
+def _get_schemas(db: Session, /, key_column: Column[str]) -> dict[str, ItemSchema]:
+    """Get a mapping of a `warehouse` column's values to the item schemas.
+
+    Args:
+        db (Session): The database session to use.
+        key_column (Column[str]): The column to key the mapping on.
+
+    Returns:
+        dict[str, ItemSchema]: The item schemas, keyed on the column's values.
+    """
+
+    if (schemas := _SCHEMAS.get(key_column.key)) is not None:
+        return schemas
+
+    statement = select(key_column, Warehouse.item_schema)  # type: ignore[arg-type]
+
+    return _SCHEMAS.set(key_column.key, dict(db.execute(statement).tuples().all()))
+
+
 def get_item_schemas(db: Session, /) -> dict[str, ItemSchema]:
     """Get a list of items and their schemas."""
-    return dict(db.query(Warehouse.item_name, Warehouse.item_schema))
+    return _get_schemas(db, Warehouse.item_name)
 
 
 def get_warehouse_schemas(db: Session, /) -> dict[str, ItemSchema]:
     """Get a list of warehouses and their schemas."""
-    return dict(db.query(Warehouse.name, Warehouse.item_schema))
+    return _get_schemas(db, Warehouse.name)
 
 
 def update_schema(
@@ -250,18 +444,25 @@ def update_schema(
     if field_name not in warehouse.item_schema:
         raise InvalidFieldsError(field_name)
 
+    # The cached warehouse is shared between requests, so a copy of its schema is
+    # updated instead. The cache is only dropped once the update is in the database.
+    item_schema = deepcopy(warehouse.item_schema)
+
     if (display_as := schema["display_as"]) == DisplayType.RESET:
-        warehouse.item_schema[field_name]["display_as"] = DisplayType.from_type_name(  # type: ignore[index]
-            warehouse.item_schema[field_name]["type"]  # type: ignore[index]
+        item_schema[field_name]["display_as"] = DisplayType.from_type_name(  # type: ignore[index]
+            item_schema[field_name]["type"]  # type: ignore[index]
         )
     else:
-        warehouse.item_schema[field_name]["display_as"] = display_as  # type: ignore[index]
+        item_schema[field_name]["display_as"] = display_as  # type: ignore[index]
 
     db.query(Warehouse).filter(Warehouse.name == warehouse_name).update(
-        warehouse.as_dict()
+        {Warehouse.item_schema: item_schema}
     )
 
     db.commit()
+    _WAREHOUSES.pop(warehouse_name)
+    _SCHEMAS.clear()
+    _WAREHOUSE_PAGES.clear()
     return get_schema(db, warehouse_name=warehouse_name)
 
 
@@ -269,44 +470,162 @@ def update_schema(
 
 
 def create_item(
-    db: Session, warehouse_name: SqlStrPath, item: GeneralItemModelType
-) -> ItemResponse:
-    """Create an item in a warehouse."""
+    db: Session,
+    warehouse_name: SqlStrPath,
+    item_json: bytes | str,
+    *,
+    client_host: str | None = None,
+) -> GeneralItemModelType:
+    """Create an item in a warehouse.
+
+    Args:
+        db (Session): The database session to use.
+        warehouse_name (str): The name of the warehouse to create the item in.
+        item_json (bytes | str): The raw JSON request body for the item, validated
+            straight into the warehouse's item schema.
+        client_host (str | None): The IP address of the client, for any fields with
+            a `func:client_ip` default.
+
+    Raises:
+        _HTTPException: Raised as an `ItemExistsError` if an item with the same primary
+            key already exists.
+        ValidationError: If the item isn't valid for the warehouse's item schema.
+
+    Returns:
+        GeneralItemModelType: The created item, as stored by the database.
+    """
 
     warehouse = get_warehouse(db, warehouse_name)
 
-    pk_values = {}
-    for pk_name in warehouse.pk_name:
-        if pk_name not in item and warehouse.item_schema[pk_name].get(  # type: ignore[attr-defined]
-            "autoincrement"
-        ) in (
-            True,
-            "auto",
-        ):
-            # Autoincrementing PK removes the need to validate the item
-            break
-        pk_values[pk_name] = item[pk_name]
-    else:
-        if get_item_by_pk(db, warehouse_name, pk_values=pk_values, no_exist_ok=True):
-            raise ItemExistsError(pk_values, warehouse_name)
+    item_schema: ItemBase = warehouse.item_schema_adapter.validate_json(
+        item_json, context={"client_host": client_host}
+    )
 
-    LOGGER.debug("Validating item into schema: %r ", item)
+    # Primary keys which weren't provided are generated by the database, so can't
+    # clash with an existing item
+    if set(warehouse.pk_name) <= item_schema.model_fields_set:
+        pk_values = item_schema.model_dump(mode="json", include=set(warehouse.pk_name))
 
-    item_schema: ItemBase = warehouse.item_schema_class.model_validate(item)
+        if get_item_by_pk(db, warehouse_name, pk_values=pk_values, no_exist_ok=True):
+            raise ItemExistsError(_pk_for_error(warehouse, pk_values), warehouse_name)
 
     LOGGER.debug("Dumping item into model: %r", item_schema)
 
     # Excluding unset values mean any default functions don't get returned as-is.
-    db_item = warehouse.item_model(**item_schema.model_dump(exclude_unset=True))
+    item_row = _insert_returning(
+        db,
+        warehouse.item_model.__table__,
+        item_schema.model_dump(exclude_unset=True),
+    )
+    db.commit()
+
+    # The returned row has any new/updated values from the database, including columns
+    # which aren't in the item schema (e.g. an implicit `id` PK). The values were
+    # validated on the way in, so they're used as-is instead of paying for a second
+    # validation pass.
+    return dict(item_row)
+
+
+def create_items(
+    db: Session,
+    warehouse_name: SqlStrPath,
+    items_json: bytes | str,
+    *,
+    client_host: str | None = None,
+) -> list[GeneralItemModelType]:
+    """Create multiple items in a warehouse in a single transaction.
+
+    Args:
+        db (Session): The database session to use.
+        warehouse_name (str): The name of the warehouse to create the items in.
+        items_json (bytes | str): The raw JSON request body: an array of items,
+            validated straight into the warehouse's item schema.
+        client_host (str | None): The IP address of the client, for any fields with
+            a `func:client_ip` default.
+
+    Raises:
+        _HTTPException: Raised as an `ItemExistsError` if any of the items' primary keys
+            are duplicated, or already exist in the warehouse.
+        ValidationError: If the body isn't an array, or any item isn't valid for the
+            warehouse's item schema.
+
+    Returns:
+        list[GeneralItemModelType]: The created items, as stored by the database, in
+            the same order as `items`.
+    """
+
+    warehouse = get_warehouse(db, warehouse_name)
+
+    # All items are validated in one pass, rather than one call per item
+    item_schemas: list[ItemBase] = warehouse.item_list_adapter.validate_json(
+        items_json, context={"client_host": client_host}
+    )
+
+    if not item_schemas:
+        return []
+
+    # Excluding unset values mean any default functions don't get returned as-is.
+    item_rows = [
+        item_schema.model_dump(exclude_unset=True) for item_schema in item_schemas
+    ]
+
+    # Items with autoincrementing PKs won't have them set, so can't clash
+    item_pks = [
+        tuple(item_row[pk_name] for pk_name in warehouse.pk_name)
+        for item_row in item_rows
+        if all(pk_name in item_row for pk_name in warehouse.pk_name)
+    ]
+
+    seen_pks: set[tuple[PythonType, ...]] = set()
+    for item_pk in item_pks:
+        if item_pk in seen_pks:
+            raise ItemExistsError(
+                _pk_for_error(
+                    warehouse, dict(zip(warehouse.pk_name, item_pk, strict=True))
+                ),
+                warehouse_name,
+            )
+        seen_pks.add(item_pk)
+
+    if item_pks and (
+        existing_pk := db.execute(
+            select(*warehouse.pk)  # type: ignore[arg-type]
+            .where(warehouse.get_pk_in_condition(item_pks))
+            .limit(1)
+        ).first()
+    ):
+        raise ItemExistsError(
+            _pk_for_error(warehouse, existing_pk._asdict()), warehouse_name
+        )
+
+    if db.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+        # The ORM groups rows by which columns they set, so items which leave different
+        # fields to their defaults can still share a multi-row INSERT. `render_nulls`
+        # stops it from swapping explicit `None`s for column defaults, which
+        # `create_item` doesn't do either.
+        created_rows = (
+            db.execute(
+                insert(warehouse.item_model).returning(  # type: ignore[call-arg]
+                    *warehouse.item_model.__table__.columns,
+                    sort_by_parameter_order=True,
+                ),
+                item_rows,
+                execution_options={"render_nulls": True},
+            )
+            .mappings()
+            .all()
+        )
+    else:
+        created_rows = [
+            _insert_returning(db, warehouse.item_model.__table__, item_row)
+            for item_row in item_rows
+        ]
 
-    db.add(db_item)
     db.commit()
-    db.refresh(db_item)
 
-    # Re-parse so that we've got any new/updated values from the database.
-    return warehouse.item_schema_class.model_validate(
-        db_item.as_dict()
-    )  # type: ignore[return-value]
+    # As in `create_item`, the whole rows are returned so that columns which aren't in
+    # the item schema (e.g. an implicit `id` PK) aren't lost
+    return [dict(created_row) for created_row in created_rows]
 
 
 def delete_item(
@@ -317,12 +636,14 @@ def delete_item(
     warehouse = get_warehouse(db, warehouse_name)
 
     if (
-        db.query(warehouse.item_model)
-        .filter(warehouse.get_pk_filter_condition(search_values))
-        .delete()
+        db.execute(
+            delete(warehouse.item_model).where(
+                warehouse.get_pk_filter_condition(search_values)
+            )
+        ).rowcount
         == 0
     ):
-        raise ItemNotFoundError(search_values)
+        raise ItemNotFoundError(search_values, warehouse_name)
 
     db.commit()
 
@@ -381,20 +702,55 @@ def get_item_by_pk(
         unknown_fields := [
             field_name
             for field_name in field_names
-            if field_name not in warehouse.item_model.__table__.columns
+            if field_name not in warehouse.item_model.column_name_set()
         ]
     ):
         raise InvalidFieldsError(unknown_fields)
 
     item_pk = warehouse.parse_pk_dict(pk_values)
 
-    if (item := db.query(warehouse.item_model).get(item_pk)) is None:
+    if (item := db.get(warehouse.item_model, item_pk)) is None:  # type: ignore[attr-defined]
         if no_exist_ok:
             return None
 
         raise ItemNotFoundError(item_pk, warehouse_name)
 
-    return item.as_dict(include=field_names)
+    return item.as_dict(include=field_names)  # type: ignore[no-any-return]
+
+
+def _parse_after_cursor(
+    warehouse: Warehouse, after: str, order_by: str | None
+) -> PythonType:
+    """Parse an `after` cursor into the PK value to continue after.
+
+    Args:
+        warehouse (Warehouse): The warehouse the items are being fetched from.
+        after (str): The primary key value of the item to continue after.
+        order_by (str | None): The field the items are being ordered by, if any.
+
+    Raises:
+        _HTTPException: Raised as an `InvalidCursorError` if the warehouse has a
+            composite primary key, the items are being ordered by another field, or the
+            cursor isn't a valid PK value.
+
+    Returns:
+        PythonType: The parsed primary key value.
+    """
+
+    if len(warehouse.pk) != 1:
+        raise InvalidCursorError(
+            after, "only warehouses with a single primary key field support it"
+        )
+
+    if order_by:
+        raise InvalidCursorError(after, "it can't be combined with `order_by`")
+
+    try:
+        (after_pk,) = warehouse.parse_pk_dict({warehouse.pk_name[0]: after})
+    except ValueError as exc:
+        raise InvalidCursorError(after, exc) from exc
+
+    return after_pk
 
 
 def get_items(
@@ -406,6 +762,7 @@ def get_items(
     search_params: QueryParamType,
     offset: int = 0,
     limit: int = 100,
+    after: str | None = None,
     include_fields: bool = False,
     order_by: str | None = None,
     ascending: bool = True,
@@ -424,6 +781,9 @@ def get_items(
             Defaults to 0.
         limit (int, optional): The limit to use when querying the database. Defaults
             to 100.
+        after (str, optional): The primary key value of the item to continue after.
+            Takes precedence over `offset`, and can't be combined with `order_by`. The
+            page won't have a page number. Defaults to None.
         include_fields (bool, optional): Whether to include the field names in the
             response. Defaults to False.
         order_by (str, optional): The field to order the results by. Defaults to None.
@@ -448,8 +808,25 @@ def get_items(
             pk_values=search_params,
         )
 
+    column_names = warehouse.item_model.column_name_set()
+
+    if unknown_fields := [
+        field_name
+        for field_name in (
+            *(field_names or ()),
+            *search_params,
+            *((order_by,) if order_by else ()),
+        )
+        if field_name not in column_names
+    ]:
+        raise InvalidFieldsError(unknown_fields)
+
+    after_pk = (
+        _parse_after_cursor(warehouse, after, order_by) if after is not None else None
+    )
+
     if not field_names:
-        query: Query[Warehouse] = db.query(warehouse.item_model)
+        selected_fields: Iterable[str] = warehouse.item_model.column_names()
     else:
         if order_by:
             field_names.append(order_by)
@@ -457,38 +834,39 @@ def get_items(
         # Always include PK for uniqueness
         field_names.extend(warehouse.pk_name)
 
-        field_names = sorted(set(field_names))
+        selected_fields = sorted(set(field_names))
 
-        try:
-            fields = tuple(
-                getattr(warehouse.item_model, field_name) for field_name in field_names
-            )
-        except AttributeError as exc:
-            raise InvalidFieldsError(exc.name) from exc
-
-        query = db.query(*fields)
+    # Columns are selected (rather than the ORM model) so that rows don't need to be
+    # loaded into model instances just to be turned into dicts
+    statement = select(
+        *(getattr(warehouse.item_model, field_name) for field_name in selected_fields)
+    )
 
     for k, v in search_params.items():
-        query = query.filter(getattr(warehouse.item_model, k) == v)
+        statement = statement.where(getattr(warehouse.item_model, k) == v)
 
     if order_by:
-        try:
-            ordered_field = getattr(warehouse.item_model, order_by)
-        except AttributeError as exc:
-            raise InvalidFieldsError(exc.name) from exc
+        ordered_field = getattr(warehouse.item_model, order_by)
 
-        query = query.order_by(
+        statement = statement.order_by(
             ordered_field.asc() if ascending else ordered_field.desc()
         )
+    else:
+        # Ordering by the PK keeps pages stable, and lets them be continued by cursor
+        statement = statement.order_by(*warehouse.pk)  # type: ignore[arg-type]
 
-    results = query.offset(offset).limit(limit).all()
-
-    if field_names:
-        items: list[GeneralItemModelType] = [
-            dict(zip(field_names, row, strict=True)) for row in results
-        ]
+    if after is not None:
+        statement = statement.where(warehouse.pk[0] > after_pk)
     else:
-        items = [row.as_dict() for row in results]
+        statement = statement.offset(offset)
+
+    statement = statement.limit(limit)
+
+    # Rows are already keyed by their column names, so they're just copied out. Values
+    # are left as-is: the response encoder handles dates and datetimes itself.
+    items: list[GeneralItemModelType] = [
+        dict(row) for row in db.execute(statement).mappings()
+    ]
 
     total = get_item_count(db, warehouse_name)
 
@@ -496,12 +874,74 @@ def get_items(
         count=len(items),
         items=items,
         max_page=total // limit,
-        page=(offset // limit) + 1,
+        page=None if after is not None else (offset // limit) + 1,
         total=total,
         include_fields=include_fields,
+        next_cursor=(
+            items[-1][warehouse.pk_name[0]]
+            if len(items) == limit and len(warehouse.pk) == 1 and not order_by
+            else None
+        ),
     )
 
 
+def get_items_batch(
+    db: Session, /, batch_requests: list[ItemBatchRequest]
+) -> list[list[GeneralItemModelType | None]]:
+    """Get batches of items from one or more warehouses.
+
+    Each warehouse is queried once, regardless of how many requests reference it.
+
+    Args:
+        db (Session): The database session to use.
+        batch_requests (list[ItemBatchRequest]): The warehouses and item PKs to get.
+
+    Returns:
+        list[list[GeneralItemModelType | None]]: The items for each request, in the
+            same order as the requested PKs. Items which don't exist are None.
+    """
+
+    warehouses: dict[str, Warehouse] = {}
+    requested_pks: list[list[tuple[PythonType, ...]]] = []
+    pks_by_warehouse: defaultdict[str, set[tuple[PythonType, ...]]] = defaultdict(set)
+
+    for batch_request in batch_requests:
+        if (warehouse := warehouses.get(batch_request.warehouse_name)) is None:
+            warehouse = warehouses[batch_request.warehouse_name] = get_warehouse(
+                db, batch_request.warehouse_name
+            )
+
+        item_pks = [
+            warehouse.parse_pk_dict(pk_values) for pk_values in batch_request.pk_values
+        ]
+
+        requested_pks.append(item_pks)
+        pks_by_warehouse[warehouse.name].update(item_pks)
+
+    items: dict[str, dict[tuple[PythonType, ...], GeneralItemModelType]] = {}
+
+    for warehouse_name, warehouse_pks in pks_by_warehouse.items():
+        warehouse = warehouses[warehouse_name]
+
+        # As in `get_items`, rows are read as mappings rather than loaded into models
+        items[warehouse_name] = {
+            tuple(row[pk_name] for pk_name in warehouse.pk_name): dict(row)
+            for row in db.execute(
+                select(
+                    *(
+                        getattr(warehouse.item_model, field_name)
+                        for field_name in warehouse.item_model.column_names()
+                    )
+                ).where(warehouse.get_pk_in_condition(warehouse_pks))
+            ).mappings()
+        }
+
+    return [
+        [items[batch_request.warehouse_name].get(item_pk) for item_pk in item_pks]
+        for batch_request, item_pks in zip(batch_requests, requested_pks, strict=True)
+    ]
+
+
 def update_item(
     db: Session,
     /,
@@ -518,12 +958,13 @@ def update_item(
 
     new_item_dict = current_item_dict | item_update
 
-    LOGGER.debug(
-        "Parsed item update into new item: %s",
-        dumps(new_item_dict, indent=2, sort_keys=True),
-    )
+    if LOGGER.isEnabledFor(DEBUG):
+        LOGGER.debug(
+            "Parsed item update into new item: %s",
+            dumps(new_item_dict, indent=2, sort_keys=True),
+        )
 
-    warehouse.item_schema_class.model_validate(new_item_dict)
+    warehouse.item_schema_adapter.validate_python(new_item_dict)
 
     try:
         db.query(warehouse.item_model).filter(
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date
+from functools import singledispatch
 from json import dumps
 from logging import getLogger
 from os import getenv
@@ -10,13 +11,20 @@ from typing import Annotated, Any, ClassVar, Literal, overload
 
 from _helpers import add_stream_handler
 from fastapi.params import Path
-from schemas import ITEM_TYPE_TYPES, DefaultFunction, GeneralItemModelType
+from schemas import (
+    ITEM_TYPE_NAMES_BY_TYPE,
+    SQL_NAME_PATTERN,
+    DefaultFunction,
+    GeneralItemModelType,
+)
 from sqlalchemy import Table
 from sqlalchemy.engine import Engine, create_engine
+from sqlalchemy.engine.url import make_url
 from sqlalchemy.orm import declarative_base, sessionmaker  # type: ignore[attr-defined]
+from sqlalchemy.pool import StaticPool
 
 LOGGER = getLogger(__name__)
-LOGGER.setLevel(getenv("LOG_LEVEL", "DEBUG"))
+LOGGER.setLevel(getenv("LOG_LEVEL", "INFO"))
 add_stream_handler(LOGGER)
 
 
@@ -88,6 +96,70 @@ else:
         ) from exc
 
 
+_MISSING = object()
+
+
+@singledispatch
+def _serialize_value(obj: Any) -> Any:
+    """Convert a value into something which can be JSON serialized.
+
+    Handlers are registered per type, so each value is dispatched with a single lookup
+    on its type rather than a chain of checks.
+
+    Args:
+        obj (Any): The value to serialize.
+
+    Raises:
+        TypeError: If there's no handler for the value's type.
+
+    Returns:
+        Any: The JSON-serializable value.
+    """
+    LOGGER.error("Failed to serialize %r: %r", type(obj), obj)
+    raise TypeError(  # noqa: TRY003
+        f"Object of type {type(obj).__name__} is not JSON serializable"
+    )
+
+
+@_serialize_value.register(str)
+@_serialize_value.register(int)
+@_serialize_value.register(float)
+@_serialize_value.register(type(None))
+def _(obj: str | float | None) -> str | float | None:
+    return obj
+
+
+@_serialize_value.register
+def _(obj: DefaultFunction) -> str:  # type: ignore[type-arg]
+    return obj.ref
+
+
+@_serialize_value.register
+def _(obj: type) -> Any:
+    if (item_type_name := ITEM_TYPE_NAMES_BY_TYPE.get(obj)) is None:
+        LOGGER.error("Failed to serialize %r: %r", type(obj), obj)
+        raise TypeError(f"Type {obj!r} is not JSON serializable")  # noqa: TRY003
+
+    return item_type_name
+
+
+@_serialize_value.register
+def _(obj: date) -> str:
+    # Also covers `datetime`, as it's a subclass of `date`
+    return obj.isoformat()
+
+
+@_serialize_value.register
+def _(obj: dict) -> dict[str, Any]:  # type: ignore[type-arg]
+    return {key: _serialize_value(value) for key, value in obj.items()}
+
+
+@_serialize_value.register(list)
+@_serialize_value.register(tuple)
+def _(obj: list | tuple) -> list[Any]:  # type: ignore[type-arg]
+    return [_serialize_value(value) for value in obj]
+
+
 class _BaseExtra:
     """Extra functionality for SQLAlchemy models."""
 
@@ -95,6 +167,9 @@ class _BaseExtra:
 
     ENGINE: ClassVar[Engine]
 
+    _column_names: ClassVar[tuple[str, ...]]
+    _column_name_set: ClassVar[frozenset[str]]
+
     def __init__(self, *_: Any, **__: Any) -> None:
         raise NotImplementedError(
             "Class _BaseExtra should not be instantiated by itself or as the primary"
@@ -102,34 +177,38 @@ class _BaseExtra:
         )
 
     @classmethod
-    def _custom_json_serializer(cls, *args: Any, **kwargs: Any) -> str:
-        return dumps(*args, default=cls._serialize, **kwargs)
+    def _cache_column_names(cls) -> None:
+        # Checking the class's own `__dict__` means subclasses never pick up their
+        # parent's columns.
+        if "_column_names" not in cls.__dict__:
+            cls._column_names = tuple(sorted(cls.__table__.columns.keys()))
+            cls._column_name_set = frozenset(cls._column_names)
 
     @classmethod
-    def _serialize(cls, obj: Any) -> Any:
-        if isinstance(obj, DefaultFunction):
-            return obj.ref
-
-        if obj in ITEM_TYPE_TYPES:
-            return obj.__name__.lower()
+    def column_names(cls) -> tuple[str, ...]:
+        """Get the (sorted) names of the model's columns.
 
-        if isinstance(obj, (date | datetime)):
-            return obj.isoformat()
+        Returns:
+            tuple[str, ...]: The column names.
+        """
+        cls._cache_column_names()
+        return cls._column_names
 
-        if isinstance(obj, dict):
-            return {key: cls._serialize(value) for key, value in obj.items()}
+    @classmethod
+    def column_name_set(cls) -> frozenset[str]:
+        """Get the names of the model's columns, for membership checks.
 
-        if isinstance(obj, list):
-            return [cls._serialize(value) for value in obj]
+        Returns:
+            frozenset[str]: The column names.
+        """
+        cls._cache_column_names()
+        return cls._column_name_set
 
-        # Check it can be JSON serialized
-        try:
-            dumps(obj)
-        except TypeError:
-            LOGGER.exception("Failed to serialize %r: %r", type(obj), obj)
-            raise
+    @classmethod
+    def _custom_json_serializer(cls, *args: Any, **kwargs: Any) -> str:
+        return dumps(*args, default=cls._serialize, **kwargs)
 
-        return obj
+    _serialize = staticmethod(_serialize_value)
 
     def as_dict(
         self, include: list[str] | None = None, exclude: list[str] | None = None
@@ -149,7 +228,7 @@ class _BaseExtra:
         Returns:
             GeneralItemModelType: The converted model.
         """
-        include = sorted(include or self.__table__.columns.keys())
+        field_names = sorted(include) if include else self.column_names()
         exclude = exclude or []
 
         if not isinstance(self, Base):
@@ -159,23 +238,45 @@ class _BaseExtra:
 
         fields: GeneralItemModelType = {}
 
-        for field in include:
+        # Loaded column values live in the instance's `__dict__`, so they're read from
+        # there directly instead of going through SQLAlchemy's attribute descriptors.
+        loaded_values = self.__dict__
+
+        for field in field_names:
             if field in exclude:
                 continue
 
-            fields[field] = self._serialize(getattr(self, field))
+            if (value := loaded_values.get(field, _MISSING)) is _MISSING:
+                value = getattr(self, field)
+
+            fields[field] = self._serialize(value)
 
         return fields
 
 
+_ENGINE_KWARGS: dict[str, Any]
+if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+    _ENGINE_KWARGS = {"connect_args": {"check_same_thread": False}}
+
+    if make_url(SQLALCHEMY_DATABASE_URL).database in (None, "", ":memory:"):
+        # Every connection to an in-memory database gets its own (empty) database, so
+        # the same connection is shared between all threads.
+        _ENGINE_KWARGS["poolclass"] = StaticPool
+else:
+    # Keep warm connections to the database server around between requests, and make
+    # sure they've not been dropped (e.g. by `wait_timeout`) before handing them out.
+    _ENGINE_KWARGS = {
+        "pool_size": int(_getenv("DATABASE_POOL_SIZE", "20")),
+        "max_overflow": int(_getenv("DATABASE_MAX_OVERFLOW", "10")),
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
 _BaseExtra.ENGINE = create_engine(
     SQLALCHEMY_DATABASE_URL,
     json_serializer=_BaseExtra._custom_json_serializer,  # pylint: disable=protected-access
-    connect_args=(
-        {"check_same_thread": False}
-        if SQLALCHEMY_DATABASE_URL.startswith("sqlite")
-        else {}
-    ),
+    **_ENGINE_KWARGS,
 )
 
 Base = declarative_base(cls=_BaseExtra)
@@ -184,7 +285,7 @@ Base = declarative_base(cls=_BaseExtra)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_BaseExtra.ENGINE)
 
 SqlStrPath = Annotated[
-    str, Path(pattern=r"^[a-zA-Z0-9_]+$", min_length=1, max_length=64)
+    str, Path(pattern=SQL_NAME_PATTERN.pattern, min_length=1, max_length=64)
 ]
 
 __all__ = ["Base", "SessionLocal", "GeneralItemModelType", "SqlStrPath"]
@@ -5,14 +5,14 @@ from __future__ import annotations
 from abc import ABC
 from collections.abc import Callable
 from json import dumps
-from logging import getLogger
+from logging import DEBUG, getLogger
 from os import environ, getenv
 
 from _helpers import add_stream_handler
 from fastapi import HTTPException, status
 
 LOGGER = getLogger(__name__)
-LOGGER.setLevel(getenv("LOG_LEVEL", "DEBUG"))
+LOGGER.setLevel(getenv("LOG_LEVEL", "INFO"))
 add_stream_handler(LOGGER)
 
 
@@ -55,7 +55,8 @@ def _http_exception_factory(
 
             self.status_code = response_status
 
-            LOGGER.debug(dumps(self.detail, default=str))
+            if LOGGER.isEnabledFor(DEBUG):
+                LOGGER.debug(dumps(self.detail, default=str))
 
     return _HTTPException
 
@@ -88,6 +89,12 @@ ItemSchemaExistsError = _http_exception_factory(
     "Item schema {!r} already exists.",
 )
 
+InvalidCursorError = _http_exception_factory(
+    "InvalidCursorError",
+    status.HTTP_400_BAD_REQUEST,
+    "Invalid pagination cursor {!r}: {!s}.",
+)
+
 InvalidFieldsError = _http_exception_factory(
     "InvalidFieldsError", status.HTTP_400_BAD_REQUEST, "Invalid field(s): {!r}."
 )
@@ -5,22 +5,20 @@ from __future__ import annotations  # noqa: I001
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from enum import StrEnum, auto
-from json import dumps
-from logging import getLogger
+from logging import DEBUG, getLogger
 from os import getenv
 from traceback import format_exception
 from typing import Annotated, Any, Literal
 
 import crud
-from _dependencies import get_db
+from _dependencies import body_validation_error, get_db, get_raw_body
 from _helpers import add_stream_handler
 from database import SQLALCHEMY_DATABASE_URL, Base, SessionLocal, SqlStrPath
-from exceptions import ItemSchemaExistsError, WarehouseExistsError
 from fastapi import Body, Depends, FastAPI, Request, Response, status
 from fastapi.exceptions import RequestValidationError, ResponseValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.params import Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from models import ItemPage
 from models import Warehouse as WarehouseModel
 from models import WarehousePage
@@ -28,6 +26,7 @@ from pydantic import ValidationError
 from schemas import (
     DisplayType,
     GeneralItemModelType,
+    ItemBatchRequest,
     ItemResponse,
     ItemSchema,
     SqlStr,
@@ -38,14 +37,21 @@ from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
 LOGGER = getLogger(__name__)
-LOGGER.setLevel(getenv("LOG_LEVEL", "DEBUG"))
+LOGGER.setLevel(getenv("LOG_LEVEL", "INFO"))
 add_stream_handler(LOGGER)
 
-try:
-    Base.metadata.create_all(bind=WarehouseModel.ENGINE)
-except OperationalError:
-    LOGGER.debug(SQLALCHEMY_DATABASE_URL)
-    raise
+# Query parameters for `GET .../items` which aren't item search parameters
+GET_ITEMS_PARAMS = frozenset(
+    (
+        "page",
+        "page_size",
+        "after",
+        "include_fields",
+        "fields",
+        "order_by",
+        "ascending",
+    )
+)
 
 
 class ApiTag(StrEnum):
@@ -58,12 +64,24 @@ class ApiTag(StrEnum):
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+async def lifespan(app_: FastAPI) -> AsyncIterator[None]:
     """Populate the item model/schema lookups before the application lifecycle starts."""
 
+    # Only the `warehouse` table is registered at this point; `create_all` skips it if
+    # it already exists. Running it here rather than at import time means importing
+    # the app (e.g. for tooling) doesn't need a database connection.
+    try:
+        Base.metadata.create_all(bind=WarehouseModel.ENGINE)
+    except OperationalError:
+        LOGGER.debug(SQLALCHEMY_DATABASE_URL)
+        raise
+
     db = SessionLocal()
 
     try:
+        # All warehouses are fetched in a single query. The models and schemas are
+        # then built one after the other: SQLAlchemy's class registry isn't safe to
+        # mutate from multiple threads.
         for warehouse in crud.get_warehouses(
             db,
             allow_no_warehouse_table=True,
@@ -74,6 +92,10 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     finally:
         db.close()
 
+    # The OpenAPI schema is static, and FastAPI keeps it once it's been generated, so
+    # build it now instead of on the first request for the docs.
+    app_.openapi()
+
     LOGGER.debug(
         "Warehouse._ITEM_SCHEMAS: %r",
         WarehouseModel._ITEM_SCHEMAS,  # pylint: disable=protected-access
@@ -95,7 +117,7 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     )
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -107,7 +129,7 @@ app.add_middleware(
 
 
 @app.exception_handler(RequestValidationError)
-def request_validation_error_handler(
+async def request_validation_error_handler(
     _: Request, exc: RequestValidationError
 ) -> JSONResponse:
     """Handle FastAPI request validation errors."""
@@ -126,7 +148,7 @@ def request_validation_error_handler(
 
 
 @app.exception_handler(ResponseValidationError)
-def response_validation_error_handler(
+async def response_validation_error_handler(
     _: Request, exc: ResponseValidationError
 ) -> JSONResponse:
     """Handle FastAPI response validation errors."""
@@ -145,7 +167,7 @@ def response_validation_error_handler(
 
 
 @app.exception_handler(SQLAlchemyError)
-def sqlalchemy_error_handler(_: Request, exc: SQLAlchemyError) -> JSONResponse:
+async def sqlalchemy_error_handler(_: Request, exc: SQLAlchemyError) -> JSONResponse:
     """Handle SQLAlchemy errors."""
     LOGGER.exception("500 Internal Server Error (%s): %s", exc.__class__.__name__, exc)
     return JSONResponse(
@@ -160,7 +182,7 @@ def sqlalchemy_error_handler(_: Request, exc: SQLAlchemyError) -> JSONResponse:
 
 
 @app.exception_handler(ValidationError)
-def validation_error_handler(_: Request, exc: ValidationError) -> JSONResponse:
+async def validation_error_handler(_: Request, exc: ValidationError) -> JSONResponse:
     """Handle Pydantic validation errors."""
     LOGGER.exception("400 Bad Request (%s): %s", exc.__class__.__name__, exc)
     return JSONResponse(
@@ -177,7 +199,7 @@ def validation_error_handler(_: Request, exc: ValidationError) -> JSONResponse:
 
 
 @app.exception_handler(Exception)
-def fallback_error_handler(_: Request, exc: Exception) -> JSONResponse:
+async def fallback_error_handler(_: Request, exc: Exception) -> JSONResponse:
     """Fallback handler fior all exceptions."""
     LOGGER.exception(
         "500 Internal Server Error **Fallback** (%s): %s", exc.__class__.__name__, exc
@@ -207,14 +229,6 @@ def create_warehouse(
 ) -> WarehouseModel:
     """Create a warehouse."""
 
-    if (
-        db_warehouse := crud.get_warehouse(db, warehouse.name, no_exist_ok=True)
-    ) is not None:
-        raise WarehouseExistsError(db_warehouse)
-
-    if crud.get_schema(db, item_name=warehouse.item_name, no_exist_ok=True) is not None:
-        raise ItemSchemaExistsError(warehouse.item_name)
-
     return crud.create_warehouse(db, warehouse)
 
 
@@ -240,10 +254,10 @@ def delete_warehouse(
 )
 def get_warehouse(
     warehouse_name: SqlStrPath, db: Session = Depends(get_db)  # noqa: B008
-) -> WarehouseModel:
+) -> ORJSONResponse:
     """Get a warehouse."""
 
-    return crud.get_warehouse(db, warehouse_name)
+    return ORJSONResponse(crud.get_warehouse(db, warehouse_name).as_response_dict())
 
 
 @app.get(
@@ -255,11 +269,22 @@ def get_warehouse(
 def get_warehouses(
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(gt=0, le=100)] = 100,
+    after: Annotated[
+        str | None,
+        Query(
+            description="The `next_cursor` of the previous page. Faster than `page`"
+            " for deep pagination, and takes precedence over it.",
+        ),
+    ] = None,
     db: Session = Depends(get_db),  # noqa: B008
-) -> WarehousePage:
+) -> ORJSONResponse:
     """List warehouses."""
 
-    return crud.get_warehouses(db, offset=(page - 1) * page_size, limit=page_size)
+    warehouse_page = crud.get_warehouses(
+        db, offset=(page - 1) * page_size, limit=page_size, after=after
+    )
+
+    return ORJSONResponse(warehouse_page.model_dump(mode="json", exclude_unset=True))
 
 
 @app.put("/v1/warehouses/{warehouse_name}", tags=[ApiTag.WAREHOUSE])
@@ -285,9 +310,9 @@ def update_warehouse(
 )
 def get_item_schema(
     warehouse_name: SqlStrPath, db: Session = Depends(get_db)  # noqa: B008
-) -> ItemSchema:
+) -> ORJSONResponse:
     """Get an warehouse's/item's schema."""
-    return crud.get_schema(db, warehouse_name=warehouse_name)
+    return ORJSONResponse(crud.get_schema(db, warehouse_name=warehouse_name))
 
 
 @app.put(
@@ -329,9 +354,9 @@ def update_item_field_definition(
 )
 def get_item_schemas(
     db: Session = Depends(get_db),  # noqa: B008
-) -> dict[str, ItemSchema]:
+) -> ORJSONResponse:
     """Get a list of items' names and schemas."""
-    return crud.get_item_schemas(db)
+    return ORJSONResponse(crud.get_item_schemas(db))
 
 
 # Item Endpoints
@@ -341,40 +366,123 @@ def get_item_schemas(
     "/v1/warehouses/{warehouse_name}/items",
     response_model=Any,
     tags=[ApiTag.ITEM],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "object"},
+                    "examples": {
+                        "default": {
+                            "value": {
+                                "name": "Joe Bloggs",
+                                "age": 42,
+                                "salary": 123456,
+                                "alive": True,
+                                "hire_date": "2021-01-01",
+                                "last_login": "2021-01-01T12:34:56",
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
 )
 def create_item(
     warehouse_name: SqlStrPath,
-    item: Annotated[
-        GeneralItemModelType,
-        Body(
-            examples=[
-                {
-                    "name": "Joe Bloggs",
-                    "age": 42,
-                    "salary": 123456,
-                    "alive": True,
-                    "hire_date": "2021-01-01",
-                    "last_login": "2021-01-01T12:34:56",
-                },
-            ]
-        ),
-    ],
     request: Request,
+    item_json: bytes = Depends(get_raw_body),
     db: Session = Depends(get_db),  # noqa: B008
-) -> ItemResponse:
-    """Create an item."""
+) -> ORJSONResponse:
+    """Create an item.
+
+    The body is validated straight from JSON into the warehouse's item schema,
+    rather than being decoded into a dict first.
+    """
 
     LOGGER.info("POST\t/v1/warehouses/%s/items", warehouse_name)
-    LOGGER.debug(dumps(item))
+    if LOGGER.isEnabledFor(DEBUG):
+        LOGGER.debug(item_json.decode())
+
+    try:
+        res = crud.create_item(
+            db,
+            warehouse_name,
+            item_json,
+            client_host=request.client.host if request.client else None,
+        )
+    except ValidationError as exc:
+        raise body_validation_error(exc, item_json) from exc
+
+    LOGGER.debug("RESPONSE: %r", res)
+
+    # As in `get_items`, the row is rendered directly rather than through FastAPI's
+    # `jsonable_encoder` pass: the response encoder handles dates and datetimes itself.
+    return ORJSONResponse(res)
 
-    if client := request.client:
-        item.update({"_request.client.host": client.host})
 
-    res = crud.create_item(db, warehouse_name, item)
+@app.post(
+    "/v1/warehouses/{warehouse_name}/items/bulk",
+    response_model=Any,
+    tags=[ApiTag.ITEM],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"type": "object"}},
+                    "examples": {
+                        "default": {
+                            "value": [
+                                {
+                                    "name": "Joe Bloggs",
+                                    "age": 42,
+                                    "salary": 123456,
+                                    "alive": True,
+                                    "hire_date": "2021-01-01",
+                                    "last_login": "2021-01-01T12:34:56",
+                                },
+                                {
+                                    "name": "Jane Doe",
+                                    "age": 37,
+                                    "salary": 234567,
+                                    "alive": True,
+                                    "hire_date": "2022-02-02",
+                                    "last_login": "2022-02-02T12:34:56",
+                                },
+                            ],
+                        },
+                    },
+                },
+            },
+        },
+    },
+)
+def create_items(
+    warehouse_name: SqlStrPath,
+    request: Request,
+    items_json: bytes = Depends(get_raw_body),
+    db: Session = Depends(get_db),  # noqa: B008
+) -> ORJSONResponse:
+    """Create multiple items in a single transaction.
+
+    Either all of the items are created, or none of them are.
+    """
 
-    LOGGER.info("RESPONSE: %r", res)
+    LOGGER.info("POST\t/v1/warehouses/%s/items/bulk", warehouse_name)
+
+    try:
+        items = crud.create_items(
+            db,
+            warehouse_name,
+            items_json,
+            client_host=request.client.host if request.client else None,
+        )
+    except ValidationError as exc:
+        raise body_validation_error(exc, items_json) from exc
 
-    return res
+    return ORJSONResponse(items)
 
 
 @app.delete(
@@ -405,6 +513,14 @@ def get_items(
     warehouse_name: SqlStrPath,
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(gt=0, le=100)] = 100,
+    after: Annotated[
+        str | None,
+        Query(
+            description="The `next_cursor` of the previous page. Faster than `page`"
+            " for deep pagination, and takes precedence over it. Only supported for"
+            " warehouses with a single primary key field, and without `order_by`.",
+        ),
+    ] = None,
     include_fields: Annotated[
         bool,
         Query(
@@ -418,7 +534,6 @@ def get_items(
                 default=None,
                 example="age,salary,name,alive",
                 description="A comma-separated list of fields to return.",
-                pattern=r"^[a-zA-Z0-9_]+(,[a-zA-Z0-9_]+)*$",
             ),
         ]
         | None
@@ -430,7 +545,6 @@ def get_items(
                 default=None,
                 example="age",
                 description="A comma-separated list of fields to order by.",
-                pattern=r"^[a-zA-Z0-9_]+(,[a-zA-Z0-9_]+)*$",
             ),
         ]
         | None
@@ -442,28 +556,21 @@ def get_items(
         ),
     ] = True,
     db: Session = Depends(get_db),  # noqa: B008
-) -> ItemPage | GeneralItemModelType:
+) -> ORJSONResponse:
     """Get items in a warehouse."""
 
     search_params = {
-        k: v
-        for k, v in request.query_params.items()
-        if k
-        not in (
-            "page",
-            "page_size",
-            "include_fields",
-            "fields",
-            "order_by",
-            "ascending",
-        )
+        k: v for k, v in request.query_params.items() if k not in GET_ITEMS_PARAMS
     }
 
-    return crud.get_items(
+    items = crud.get_items(
         db,
         warehouse_name,
         offset=(page - 1) * page_size,
         limit=page_size,
+        after=after,
+        # Field names aren't pattern-checked here: `get_items` rejects any which aren't
+        # columns of the warehouse, which covers malformed names too.
         field_names=fields.split(",") if fields else None,
         search_params=search_params,
         include_fields=include_fields,
@@ -471,6 +578,46 @@ def get_items(
         ascending=ascending,
     )
 
+    # The items are already plain JSON-compatible dicts, so they're rendered directly
+    # instead of being validated against the response model again. The response model
+    # is still used for the OpenAPI docs.
+    if isinstance(items, ItemPage):
+        return ORJSONResponse(items.model_dump())
+
+    return ORJSONResponse(items)
+
+
+@app.post(
+    "/v1/items/batch",
+    response_model=list[list[ItemResponse | None]],
+    tags=[ApiTag.ITEM],
+)
+def get_items_batch(
+    batch_requests: Annotated[
+        list[ItemBatchRequest],
+        Body(
+            examples=[
+                [
+                    {
+                        "warehouse_name": "payroll",
+                        "pk_values": [
+                            {
+                                "employee_number": 1,
+                                "hire_date": "2021-01-01",
+                                "name": "Joe Bloggs",
+                            },
+                        ],
+                    },
+                ],
+            ]
+        ),
+    ],
+    db: Session = Depends(get_db),  # noqa: B008
+) -> list[list[GeneralItemModelType | None]]:
+    """Get items from one or more warehouses by their primary keys."""
+
+    return crud.get_items_batch(db, batch_requests)
+
 
 @app.put(
     "/v1/warehouses/{warehouse_name}/items",
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from datetime import date, datetime
+from functools import lru_cache
 from json import dumps
-from logging import getLogger
+from logging import DEBUG, getLogger
 from os import getenv
 from typing import Any, ClassVar, Self
 
@@ -16,34 +17,127 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    TypeAdapter,
     ValidationInfo,
     create_model,
     field_serializer,
     field_validator,
 )
 from schemas import (
+    PYTHON_TYPES,
     DefaultFunctionType,
     GeneralItemModelType,
     ItemAttributeType,
     ItemBase,
     ItemFieldDefinition,
     ItemResponse,
+    ItemSchema,
     ItemUpdateBase,
     PythonType,
     QueryParamType,
 )
 from schemas import Warehouse as WarehouseSchema
-from sqlalchemy import JSON, Column, DateTime, Integer, String, and_
+from sqlalchemy import JSON, Column, DateTime, Integer, String, and_, tuple_
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.orm.decl_api import DeclarativeMeta
-from sqlalchemy.sql.elements import BooleanClauseList
+from sqlalchemy.sql.elements import BooleanClauseList, ColumnElement
 
 LOGGER = getLogger(__name__)
-LOGGER.setLevel(getenv("LOG_LEVEL", "DEBUG"))
+LOGGER.setLevel(getenv("LOG_LEVEL", "INFO"))
 add_stream_handler(LOGGER)
 
+_ITEM_SCHEMA_ADAPTER: TypeAdapter[ItemSchema] = TypeAdapter(ItemSchema)
+
+
+@lru_cache
+def _camel_case(snake_case: str) -> str:
+    """Convert a snake_case string to CamelCase."""
+
+    return "".join(word.capitalize() for word in snake_case.split("_"))
+
+
+@lru_cache(maxsize=256)
+def _parse_item_schema(
+    item_schema_json: str,
+) -> dict[str, ItemFieldDefinition[ItemAttributeType]]:
+    """Parse a serialized item schema into its field definitions.
+
+    The result is cached, so building a warehouse's SQLAlchemy model and its Pydantic
+    schema only validates the field definitions once.
+
+    Args:
+        item_schema_json (str): The item schema, serialized as JSON.
+
+    Returns:
+        dict[str, ItemFieldDefinition]: The validated field definitions.
+    """
+
+    # The whole schema is validated in a single call, rather than once per field
+    return _ITEM_SCHEMA_ADAPTER.validate_json(item_schema_json)
+
+
+@lru_cache(maxsize=256)
+def _build_item_schema_class(item_name: str, item_schema_json: str) -> ItemBase:
+    """Create a Pydantic schema for an item.
+
+    Schemas are cached on the item name and serialized item schema, so re-creating a
+    warehouse with an identical definition doesn't rebuild the model.
+
+    Args:
+        item_name (str): The name of the item.
+        item_schema_json (str): The item schema, serialized as JSON.
+
+    Returns:
+        ItemBase: The Pydantic schema for the item.
+    """
+
+    pydantic_schema = {}
+
+    for field_name, field_definition in _parse_item_schema(item_schema_json).items():
+        field_kwargs: dict[str, PythonType | DefaultFunctionType[PythonType]] = {}
+
+        if "default" in field_definition.model_fields_set:
+            if callable(field_definition.default):
+                field_kwargs["default_factory"] = field_definition.default
+            else:
+                field_kwargs["default"] = field_definition.default
+        elif field_definition.primary_key and field_definition.autoincrement in (
+            True,
+            "auto",
+        ):
+            # Set the Pydantic default to None for autoincrementing primary keys
+            # so that the database can generate the value.
+            field_kwargs["default"] = None
+
+        if max_length := field_definition.type_kwargs.get("length"):
+            field_kwargs["max_length"] = max_length
+
+        field_type = (
+            PYTHON_TYPES[field_definition.type] | None
+            if field_definition.nullable is True
+            else PYTHON_TYPES[field_definition.type]
+        )
+
+        pydantic_schema[field_name] = (
+            field_type,
+            Field(**field_kwargs),  # type: ignore[arg-type,pydantic-field]
+        )
+
+    schema: ItemBase = create_model(  # type: ignore[call-overload]
+        __model_name=_camel_case(item_name),
+        __base__=ItemBase,
+        **pydantic_schema,
+    )
+
+    LOGGER.info("Created Pydantic schema %r", schema)
+
+    if LOGGER.isEnabledFor(DEBUG):
+        LOGGER.debug("Pydantic schema %r: %s", schema, schema.model_json_schema())
+
+    return schema
+
 
 class Warehouse(Base):  # type: ignore[misc]
     """A Warehouse is just a table: a place where items are stored."""
@@ -52,7 +146,11 @@ class Warehouse(Base):  # type: ignore[misc]
 
     _ITEM_MODELS: ClassVar[dict[str, DeclarativeMeta]] = {}
     _ITEM_SCHEMAS: ClassVar[dict[str, ItemBase]] = {}
+    _ITEM_SCHEMA_ADAPTERS: ClassVar[dict[str, TypeAdapter[ItemBase]]] = {}
+    _ITEM_LIST_ADAPTERS: ClassVar[dict[str, TypeAdapter[list[ItemBase]]]] = {}
     _ITEM_UPDATE_SCHEMAS: ClassVar[dict[str, ItemUpdateBase]] = {}
+    _ITEM_PKS: ClassVar[dict[str, tuple[InstrumentedAttribute, ...]]] = {}
+    _ITEM_PK_NAMES: ClassVar[dict[str, tuple[str, ...]]] = {}
 
     name: Column[str] = Column(
         name="name", type_=String(length=255), primary_key=True, unique=True, index=True
@@ -82,6 +180,23 @@ class Warehouse(Base):  # type: ignore[misc]
 
         return cls._ITEM_MODELS.get(warehouse_name)
 
+    def as_response_dict(self) -> dict[str, Any]:
+        """Get this warehouse in the shape of the `Warehouse` response schema.
+
+        The stored values were validated when the warehouse was created, so they're
+        used as-is rather than being revalidated on every read.
+
+        Returns:
+            dict[str, Any]: The warehouse's name, creation time, item name and schema.
+        """
+
+        return {
+            "name": self.name,
+            "created_at": self.created_at,
+            "item_name": self.item_name,
+            "item_schema": self.item_schema,
+        }
+
     def search_params_are_pks(self, search_params: dict[str, Any]) -> bool:
         """Check if the given search params are the primary key for this warehouse.
 
@@ -112,10 +227,25 @@ class Warehouse(Base):  # type: ignore[misc]
             else:
                 raise
         finally:
-            Base.metadata.remove(self.item_model.__table__)
+            self.clear_item_caches()
+
+    def clear_item_caches(self) -> None:
+        """Forget the item model, schemas and validators built for this warehouse.
+
+        They're all keyed on the warehouse's name, so they have to be cleared whenever a
+        warehouse with that name is dropped or created. Otherwise, a new warehouse would
+        be validated against the schema of an old one with the same name.
+        """
+
+        if (item_model := self._ITEM_MODELS.pop(self.name, None)) is not None:
+            Base.metadata.remove(item_model.__table__)
 
-            self._ITEM_MODELS.pop(self.name, None)
-            self._ITEM_SCHEMAS.pop(self.name, None)
+        self._ITEM_SCHEMAS.pop(self.name, None)
+        self._ITEM_SCHEMA_ADAPTERS.pop(self.name, None)
+        self._ITEM_LIST_ADAPTERS.pop(self.name, None)
+        self._ITEM_UPDATE_SCHEMAS.pop(self.name, None)
+        self._ITEM_PKS.pop(self.name, None)
+        self._ITEM_PK_NAMES.pop(self.name, None)
 
     def intialise_warehouse(self) -> None:
         """Create a new physical table for storing items in."""
@@ -142,6 +272,27 @@ class Warehouse(Base):  # type: ignore[misc]
             *(a == b for a, b in zip(self.pk, self.parse_pk_dict(pk_dict), strict=True))
         )
 
+    def get_pk_in_condition(
+        self, item_pks: Collection[tuple[PythonType, ...]]
+    ) -> ColumnElement[bool]:
+        """Get the SQLAlchemy filter condition for matching any of the given PKs.
+
+        Args:
+            item_pks (Collection[tuple[PythonType, ...]]): The parsed primary keys to
+                match, as returned by `parse_pk_dict`.
+
+        Returns:
+            ColumnElement[bool]: The SQLAlchemy filter condition for the given primary
+                keys.
+        """
+
+        if len(self.pk) == 1:
+            return self.pk[0].in_(  # type: ignore[no-any-return]
+                item_pk[0] for item_pk in item_pks
+            )
+
+        return tuple_(*self.pk).in_(item_pks)  # type: ignore[call-overload,no-any-return]
+
     def parse_pk_dict(
         self, pk_dict: GeneralItemModelType | QueryParamType
     ) -> tuple[PythonType, ...]:
@@ -162,10 +313,14 @@ class Warehouse(Base):  # type: ignore[misc]
         item_pk = []
 
         for pk in self.pk:
-            if pk.type.python_type in (date, datetime):
-                item_pk.append(pk.type.python_type.fromisoformat(pk_dict[pk.name]))
+            python_type = PYTHON_TYPES[type(pk.type)]
+            value = pk_dict[pk.name]
+
+            if issubclass(python_type, date):
+                # Also covers `datetime`, as it's a subclass of `date`
+                item_pk.append(python_type.fromisoformat(str(value)))
             else:
-                item_pk.append(pk.type.python_type(pk_dict[pk.name]))
+                item_pk.append(python_type(value))
 
         return tuple(item_pk)
 
@@ -180,14 +335,14 @@ class Warehouse(Base):  # type: ignore[misc]
 
             user_defined_pk_fields = []
 
-            _field_def: ItemFieldDefinition[ItemAttributeType]
-            for field_name, _field_def in self.item_schema.items():
+            field_definitions = _parse_item_schema(self._item_schema_json)
+
+            # Iterate over the stored schema to keep the columns in their defined order
+            for field_name in self.item_schema:
                 if field_name in model_fields:
                     raise DuplicateFieldError(field_name)
 
-                field_definition: ItemFieldDefinition[ItemAttributeType] = (
-                    ItemFieldDefinition.model_validate(_field_def)
-                )
+                field_definition = field_definitions[field_name]
 
                 model_fields[field_name] = field_definition.model_dump_column(
                     field_name=field_name
@@ -212,102 +367,92 @@ class Warehouse(Base):  # type: ignore[misc]
 
             model_fields["__tablename__"] = self.name
 
-            LOGGER.info(
-                "Model fields:\n%s",
-                dumps(model_fields, indent=2, default=repr, sort_keys=True),
-            )
-
-            item_name_camel_case = "".join(
-                word.capitalize() for word in self.item_name.split("_")
-            )
+            if LOGGER.isEnabledFor(DEBUG):
+                LOGGER.debug(
+                    "Model fields:\n%s",
+                    dumps(model_fields, indent=2, default=repr, sort_keys=True),
+                )
 
             self._ITEM_MODELS[self.name] = type(  # type: ignore[assignment]
-                item_name_camel_case, (Base,), model_fields
+                _camel_case(self.item_name), (Base,), model_fields
             )
 
         return self._ITEM_MODELS[self.name]
 
+    @property
+    def _item_schema_json(self) -> str:
+        """Get the item schema as canonical JSON, for keying the schema caches."""
+
+        return str(self._custom_json_serializer(self.item_schema, sort_keys=True))
+
     @property
     def item_schema_class(self) -> ItemBase:
         """Create a Pydantic schema from the SQLAlchemy model."""
 
         if self.name not in self._ITEM_SCHEMAS:
-            item_schema_parsed: dict[str, ItemFieldDefinition[ItemAttributeType]]
-
-            item_schema_parsed = {
-                field_name: ItemFieldDefinition.model_validate(field_definition)
-                for (
-                    field_name,
-                    field_definition,
-                ) in self.item_schema.items()
-            }
-
-            pydantic_schema = {}
-
-            for field_name, field_definition in item_schema_parsed.items():
-                field_kwargs: dict[
-                    str, PythonType | DefaultFunctionType[PythonType]
-                ] = {}
-
-                if "default" in field_definition.model_fields_set:
-                    if callable(field_definition.default):
-                        field_kwargs["default_factory"] = field_definition.default
-                    else:
-                        field_kwargs["default"] = field_definition.default
-                elif (
-                    field_definition.primary_key
-                    and field_definition.autoincrement in (True, "auto")
-                ):
-                    # Set the Pydantic default to None for autoincrementing primary keys
-                    # so that the database can generate the value.
-                    field_kwargs["default"] = None
-
-                if max_length := field_definition.type_kwargs.get("length"):
-                    field_kwargs["max_length"] = max_length
-
-                field_type = (
-                    field_definition.type().python_type | None
-                    if field_definition.nullable is True
-                    else field_definition.type().python_type
-                )
+            self._ITEM_SCHEMAS[self.name] = _build_item_schema_class(
+                self.item_name, self._item_schema_json
+            )
 
-                pydantic_schema[field_name] = (
-                    field_type,
-                    Field(**field_kwargs),  # type: ignore[arg-type,pydantic-field]
-                )
+        return self._ITEM_SCHEMAS[self.name]
 
-            item_name_camel_case = "".join(
-                word.capitalize() for word in self.item_name.split("_")
-            )
+    @property
+    def _built_item_schema_class(self) -> ItemBase:
+        """Get the item schema class, building its validator if it's not been yet.
 
-            schema: ItemBase = create_model(  # type: ignore[call-overload]
-                __model_name=item_name_camel_case,
-                __base__=ItemBase,
-                **pydantic_schema,
-            )
+        Item schemas defer building until they're needed (see `ItemBase`), which is
+        when the first adapter for them is created. Building is a no-op after that.
+        """
+
+        schema_class = self.item_schema_class
+        schema_class.model_rebuild()
 
-            LOGGER.info(
-                "Created Pydantic schema %r: %s", schema, schema.model_json_schema()
+        return schema_class
+
+    @property
+    def item_schema_adapter(self) -> TypeAdapter[ItemBase]:
+        """Get a reusable validator for this warehouse's items."""
+
+        if self.name not in self._ITEM_SCHEMA_ADAPTERS:
+            self._ITEM_SCHEMA_ADAPTERS[self.name] = TypeAdapter(
+                self._built_item_schema_class
             )
 
-            self._ITEM_SCHEMAS[self.name] = schema
+        return self._ITEM_SCHEMA_ADAPTERS[self.name]
 
-        return self._ITEM_SCHEMAS[self.name]
+    @property
+    def item_list_adapter(self) -> TypeAdapter[list[ItemBase]]:
+        """Get a reusable validator for lists of this warehouse's items."""
+
+        if self.name not in self._ITEM_LIST_ADAPTERS:
+            self._ITEM_LIST_ADAPTERS[self.name] = TypeAdapter(
+                list[self._built_item_schema_class]  # type: ignore[name-defined]
+            )
+
+        return self._ITEM_LIST_ADAPTERS[self.name]
 
     @property
     def pk(self) -> tuple[InstrumentedAttribute, ...]:
         """Get primary key field(s) for this warehouse."""
 
-        return tuple(
-            getattr(self.item_model, pk.name)
-            for pk in inspect(self.item_model).primary_key
-        )
+        if self.name not in self._ITEM_PKS:
+            self._ITEM_PKS[self.name] = tuple(
+                getattr(self.item_model, pk.name)
+                for pk in inspect(self.item_model).primary_key
+            )
+
+        return self._ITEM_PKS[self.name]
 
     @property
     def pk_name(self) -> tuple[str, ...]:
         """Get the name of the primary key field(s) for this warehouse."""
 
-        return tuple(pk.name for pk in inspect(self.item_model).primary_key)
+        if self.name not in self._ITEM_PK_NAMES:
+            self._ITEM_PK_NAMES[self.name] = tuple(
+                pk.name for pk in inspect(self.item_model).primary_key
+            )
+
+        return self._ITEM_PK_NAMES[self.name]
 
 
 class _Page(BaseModel):
@@ -315,9 +460,13 @@ class _Page(BaseModel):
 
     count: int
     max_page: int
-    page: int
+    # Pages fetched with a cursor (`after`) don't have a page number
+    page: int | None
     total: int
 
+    # Pass as `after` to get the next page without an `OFFSET` scan
+    next_cursor: PythonType = None
+
     model_config: ClassVar[ConfigDict] = {"arbitrary_types_allowed": True}
 
     @classmethod
@@ -384,9 +533,7 @@ class WarehousePage(_Page):
         return cls(count=0, total=0, max_page=0, page=0, warehouses=[])
 
     @field_serializer("warehouses", when_used="json")
-    def serialize_warehouses(
-        self, warehouses: list[Warehouse]
-    ) -> list[WarehouseSchema]:
-        """Serialize warehouses to schemas."""
+    def serialize_warehouses(self, warehouses: list[Warehouse]) -> list[dict[str, Any]]:
+        """Serialize warehouses in the shape of the `Warehouse` schema."""
 
-        return [WarehouseSchema.model_validate(warehouse) for warehouse in warehouses]
+        return [warehouse.as_response_dict() for warehouse in warehouses]
@@ -6,7 +6,7 @@ from collections.abc import Callable
 from datetime import UTC, date, datetime
 from enum import Enum, StrEnum
 from json import dumps
-from logging import getLogger
+from logging import DEBUG, getLogger
 from os import getenv
 from re import Pattern
 from re import compile as re_compile
@@ -14,15 +14,13 @@ from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Generic, Literal, Ty
 from uuid import uuid4
 
 from _helpers import add_stream_handler
-from annotated_types import Len
-from bidict import MutableBidict, bidict
 from exceptions import MissingTypeArgumentError, ValueMustBeOneOfError
 from fastapi import HTTPException, status
 from pydantic import (
-    AfterValidator,
     BaseModel,
     ConfigDict,
     Field,
+    StringConstraints,
     ValidationInfo,
     field_serializer,
     field_validator,
@@ -48,7 +46,7 @@ else:
     from sqlalchemy import Double
 
 LOGGER = getLogger(__name__)
-LOGGER.setLevel(getenv("LOG_LEVEL", "DEBUG"))
+LOGGER.setLevel(getenv("LOG_LEVEL", "INFO"))
 add_stream_handler(LOGGER)
 
 
@@ -114,33 +112,34 @@ class DisplayType(StrEnum):
         }[name]
 
 
-ITEM_TYPE_TYPES = tuple(item_type.value for item_type in ItemType)
-
-SQL_NAME_PATTERN = re_compile(r"^[a-zA-Z0-9_]+$")
+ITEM_TYPE_TYPES = frozenset(item_type.value for item_type in ItemType)
 
+ITEM_TYPES_BY_NAME: dict[str, ItemAttributeType] = {
+    name: item_type.value for name, item_type in ItemType.__members__.items()
+}
 
-def _validate_sql_identifier(value: str) -> str:
-    """Validate a SQL identifier.
+ITEM_TYPE_NAMES_BY_TYPE: dict[ItemAttributeType, str] = {
+    item_type: name for name, item_type in ITEM_TYPES_BY_NAME.items()
+}
 
-    Args:
-        value (str): The value to validate.
+# Only used in error messages, but there's no need to rebuild it for each one.
+ITEM_TYPE_NAMES_FOR_ERRORS = ", ".join(ITEM_TYPES_BY_NAME)
 
-    Raises:
-        ValueError: If the value is not a valid SQL identifier.
-
-    Returns:
-        str: The value, if it is a valid SQL identifier.
-    """
-    if not SQL_NAME_PATTERN.fullmatch(value):
-        raise ValueError(f"{value!r} is not a valid SQL identifier.")  # noqa: TRY003
+# Instantiating a SQLAlchemy type just to read its `python_type` isn't free, so it's
+# done once per type here. SQLAlchemy types `python_type` loosely (e.g. `Float` could be
+# `Decimal`), so the values are too.
+PYTHON_TYPES: dict[ItemAttributeType, type[Any]] = {
+    item_type.value: item_type.value().python_type for item_type in ItemType
+}
 
-    return value
+SQL_NAME_PATTERN = re_compile(r"^[a-zA-Z0-9_]+$")
 
 
+# The pattern is checked by pydantic-core's compiled regex, rather than calling back
+# into Python for every name.
 SqlStr = Annotated[
     str,
-    Len(min_length=1, max_length=64),
-    AfterValidator(_validate_sql_identifier),
+    StringConstraints(min_length=1, max_length=64, pattern=SQL_NAME_PATTERN.pattern),
 ]
 
 # Warehouse Schemas
@@ -155,15 +154,13 @@ DefaultFunctionType = Callable[..., DFT]
 class DefaultFunction(UserDefinedType[DFT]):
     """A default function for an ItemFieldDefinition."""
 
-    _FUNCTIONS: MutableBidict[str, DefaultFunctionType[PythonType]] = bidict(
-        {
-            # IP is always overridden in ItemBase.model_validate
-            "client_ip": lambda: 0,  # type: ignore[arg-type]
-            "today": date.today,
-            "utcnow": lambda: datetime.now(UTC),
-            "uuid4": lambda: str(uuid4()),
-        }
-    )
+    _FUNCTIONS: ClassVar[dict[str, DefaultFunctionType[PythonType]]] = {
+        # IP is always overridden in ItemBase.model_validate
+        "client_ip": lambda: 0,
+        "today": date.today,
+        "utcnow": lambda: datetime.now(UTC),
+        "uuid4": lambda: str(uuid4()),
+    }
 
     def __init__(self, name: str, func: DefaultFunctionType[PythonType]) -> None:
         """Initialise a default function.
@@ -261,7 +258,7 @@ class ItemFieldDefinition(BaseModel, Generic[SqlT]):
     def json_serialize_type(self, typ: SqlT) -> str:
         """Serialize the Item type."""
 
-        return typ.__name__.lower()
+        return ITEM_TYPE_NAMES_BY_TYPE.get(typ) or typ.__name__.lower()
 
     @field_validator("type", mode="before")
     @classmethod
@@ -269,19 +266,19 @@ class ItemFieldDefinition(BaseModel, Generic[SqlT]):
         """Validate the ItemFieldDefinition type field."""
 
         if isinstance(typ, str):
-            try:
-                LOGGER.debug("Converting string %r to ItemType", typ)
-                typ = ItemType[typ.lower()].value  # type: ignore[assignment]
-            except KeyError as exc:
+            LOGGER.debug("Converting string %r to ItemType", typ)
+            if (item_type := ITEM_TYPES_BY_NAME.get(typ.lower())) is None:
                 raise ValueMustBeOneOfError(
-                    typ, ItemType.__members__.keys(), cls._STRING_PATTERN.pattern
-                ) from exc
+                    typ, ITEM_TYPE_NAMES_FOR_ERRORS, cls._STRING_PATTERN.pattern
+                )
+
+            typ = item_type  # type: ignore[assignment]
 
         if isinstance(typ, type):
             # Not isinstance because typ is a literal type
             if typ not in ITEM_TYPE_TYPES:
                 raise ValueMustBeOneOfError(
-                    typ, ItemType.__members__.keys(), cls._STRING_PATTERN.pattern
+                    typ, ITEM_TYPE_NAMES_FOR_ERRORS, cls._STRING_PATTERN.pattern
                 )
 
             if (
@@ -302,19 +299,17 @@ class ItemFieldDefinition(BaseModel, Generic[SqlT]):
     ) -> PythonType | DefaultFunction[PythonType]:
         """Validate the ItemFieldDefinition default field."""
 
-        if isinstance(default, str):
-            match default.split(":", 1):
-                case "func", func_name:
-                    default_func: DefaultFunction[PythonType] | None
-                    if not (default_func := DefaultFunction.get_by_name(func_name)):
-                        raise ValueMustBeOneOfError(
-                            func_name,
-                            DefaultFunction.get_names(),
-                        )
+        if isinstance(default, str) and default.startswith("func:"):
+            func_name = default.partition(":")[2]
+
+            default_func: DefaultFunction[PythonType] | None
+            if not (default_func := DefaultFunction.get_by_name(func_name)):
+                raise ValueMustBeOneOfError(
+                    func_name,
+                    DefaultFunction.get_names(),
+                )
 
-                    default = default_func
-                case _:
-                    pass
+            default = default_func
 
         return default
 
@@ -323,15 +318,25 @@ class ItemFieldDefinition(BaseModel, Generic[SqlT]):
     def validate_model(cls, values: dict[str, object]) -> dict[str, object]:
         """Either validate or populate the display_as field."""
 
-        if not values.get("display_as"):
-            values["display_as"] = DisplayType.from_type_name(str(values["type"]))
+        typ = values.get("type")
+        type_name = (typ.__name__ if isinstance(typ, type) else str(typ)).lower()
+
+        if not values.get("display_as") and type_name in ITEM_TYPES_BY_NAME:
+            # Unknown types are left for `validate_type` to reject
+            values["display_as"] = DisplayType.from_type_name(type_name)
 
         return values
 
     def model_dump_column(self, field_name: str | None = None) -> Column[SqlT]:
         """Dump the ItemFieldDefinition as a SQLAlchemy Column."""
 
-        params = self.model_dump(exclude_unset=True)
+        # The set fields are read directly rather than via `model_dump`, which would
+        # walk (and copy) the whole model. `display_as` is only for the API's consumers,
+        # so isn't passed to the Column.
+        params: dict[str, Any] = {
+            field_name: getattr(self, field_name)
+            for field_name in self.model_fields_set - {"display_as"}
+        }
 
         if field_name is not None:
             params["name"] = field_name
@@ -343,10 +348,11 @@ class ItemFieldDefinition(BaseModel, Generic[SqlT]):
 
         params["type_"] = type_
 
-        LOGGER.debug(
-            "Dumping ItemFieldDefinition as Column: %s",
-            dumps(params, indent=2, sort_keys=True, default=repr),
-        )
+        if LOGGER.isEnabledFor(DEBUG):
+            LOGGER.debug(
+                "Dumping ItemFieldDefinition as Column: %s",
+                dumps(params, indent=2, sort_keys=True, default=repr),
+            )
 
         return Column(**params)
 
@@ -444,19 +450,34 @@ class Warehouse(WarehouseBase):
 
 
 class ItemBase(BaseModel):
-    """Base model for items."""
+    """Base model for items.
+
+    Building each warehouse's item model is deferred until it's first used to validate
+    something, so warehouses which are only read from never pay for it.
+    """
 
     model_config: ClassVar[ConfigDict] = {
         "arbitrary_types_allowed": True,
+        "defer_build": True,
         "extra": "forbid",
     }
 
     @model_validator(mode="before")
     @classmethod
-    def validate_model(cls, values: dict[str, object]) -> dict[str, object]:
-        """Validate the Item model."""
+    def validate_model(
+        cls, values: dict[str, object], info: ValidationInfo
+    ) -> dict[str, object]:
+        """Validate the Item model.
 
-        client_ip = values.pop("_request.client.host", None)
+        The client's IP address (for `func:client_ip` defaults) is passed in the
+        validation context as `client_host`.
+        """
+
+        if not isinstance(values, dict):
+            # Let Pydantic raise its own error for non-object input
+            return values
+
+        client_ip = (info.context or {}).get("client_host")
 
         for field, v in cls.model_fields.items():
             if (
@@ -489,6 +510,7 @@ class ItemUpdateBase(BaseModel):
     """Base model for item update requests."""
 
     model_config: ClassVar[ConfigDict] = {
+        "defer_build": True,
         "extra": "allow",
     }
 
@@ -498,3 +520,10 @@ ItemSchema = dict[SqlStr, ItemFieldDefinition[ItemAttributeType]]
 GeneralItemModelType = dict[SqlStr, PythonType | None]
 
 QueryParamType = dict[str, str]
+
+
+class ItemBatchRequest(BaseModel):
+    """A request for a batch of items from a single warehouse."""
+
+    warehouse_name: SqlStr
+    pk_values: list[GeneralItemModelType]
@@ -0,0 +1,9 @@
+"""Configuration for the tests, which run against an in-memory SQLite database."""
+
+from __future__ import annotations
+
+from os import environ
+
+# Set before the test modules import `database`, which connects on import
+environ.setdefault("DATABASE_URL", "sqlite://")
+environ.setdefault("DATABASE_DRIVER_NAME", "sqlite")
@@ -0,0 +1,141 @@
+"""Tests for the CRUD operations."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from json import dumps
+
+import crud
+import pytest
+from database import Base, SessionLocal
+from schemas import DisplayType, WarehouseCreate
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+WAREHOUSE_NAME = "messages"
+
+
+@pytest.fixture(name="db")
+def db_() -> Generator[Session, None, None]:
+    """Create the `warehouse` table and a warehouse without an explicit PK."""
+
+    Base.metadata.create_all(bind=Base.ENGINE)
+    db = SessionLocal()
+
+    crud.create_warehouse(
+        db,
+        WarehouseCreate.model_validate(
+            {
+                "name": WAREHOUSE_NAME,
+                "item_name": "message",
+                "item_schema": {
+                    "text": {
+                        "type": "string",
+                        "type_kwargs": {"length": 64},
+                        "nullable": False,
+                    },
+                    "sent": {"type": "date", "nullable": True, "default": None},
+                },
+            }
+        ),
+    )
+
+    yield db
+
+    crud.delete_warehouse(db, WAREHOUSE_NAME)
+    db.close()
+
+
+def test_create_warehouse_recreated_uses_new_schema(db: Session) -> None:
+    """A warehouse deleted elsewhere can be recreated with a different schema."""
+
+    crud.create_item(db, WAREHOUSE_NAME, '{"text": "a"}')
+
+    # Delete the warehouse as another process would, leaving this one's caches
+    db.execute(text(f"DROP TABLE {WAREHOUSE_NAME}"))
+    db.execute(
+        text("DELETE FROM warehouse WHERE name = :name"),
+        {"name": WAREHOUSE_NAME},
+    )
+    db.commit()
+    crud._WAREHOUSES.clear()  # pylint: disable=protected-access
+
+    crud.create_warehouse(
+        db,
+        WarehouseCreate.model_validate(
+            {
+                "name": WAREHOUSE_NAME,
+                "item_name": "message",
+                "item_schema": {"count": {"type": "integer", "nullable": False}},
+            }
+        ),
+    )
+
+    assert crud.create_item(db, WAREHOUSE_NAME, '{"count": 3}') == {
+        "id": 1,
+        "count": 3,
+    }
+
+
+def test_create_item_returns_implicit_pk(db: Session) -> None:
+    """The database-generated `id` is returned with the created item."""
+
+    first = crud.create_item(db, WAREHOUSE_NAME, '{"text": "a"}')
+    second = crud.create_item(db, WAREHOUSE_NAME, '{"text": "b"}')
+
+    assert first == {"id": 1, "text": "a", "sent": None}
+    assert second == {"id": 2, "text": "b", "sent": None}
+
+
+def test_create_items_returns_implicit_pks(db: Session) -> None:
+    """Each created item is returned with its database-generated `id`."""
+
+    created = crud.create_items(
+        db,
+        WAREHOUSE_NAME,
+        '[{"text": "a"}, {"text": "b", "sent": "2021-01-01"}]',
+    )
+
+    assert [item["id"] for item in created] == [1, 2]
+    assert [item["text"] for item in created] == ["a", "b"]
+
+
+def test_get_items_cursor_pages_have_no_page_number(db: Session) -> None:
+    """Pages fetched with `after` don't report a page number."""
+
+    crud.create_items(db, WAREHOUSE_NAME, dumps([{"text": "a"}] * 6))
+
+    first_page = crud.get_items(db, WAREHOUSE_NAME, search_params={}, limit=2)
+    third_page = crud.get_items(
+        db, WAREHOUSE_NAME, search_params={}, limit=2, after="4"
+    )
+
+    assert first_page.page == 1
+    assert third_page.page is None
+    assert [item["id"] for item in third_page.items] == [5, 6]
+
+
+def test_get_warehouses_cursor_pages_have_no_page_number(db: Session) -> None:
+    """Pages fetched with `after` don't report a page number."""
+
+    assert crud.get_warehouses(db, limit=1).page == 1
+    assert crud.get_warehouses(db, limit=1, after="a").page is None
+
+
+def test_update_schema_does_not_modify_cached_warehouse(db: Session) -> None:
+    """The update is stored without changing the previously cached warehouse."""
+
+    cached = crud.get_warehouse(db, WAREHOUSE_NAME)
+
+    crud.update_schema(
+        db,
+        schema={"display_as": DisplayType.json},
+        field_name="text",
+        warehouse_name=WAREHOUSE_NAME,
+    )
+
+    assert cached.item_schema["text"]["display_as"] == DisplayType.text
+    assert (
+        crud.get_warehouse(db, WAREHOUSE_NAME).item_schema["text"]["display_as"]
+        == DisplayType.json
+    )